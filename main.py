@@ -9,16 +9,206 @@ from qrcode.image.styles.moduledrawers.pil import (
     VerticalBarsDrawer
 )
 from qrcode.image.styles.colormasks import (
+    SolidFillColorMask,
     RadialGradiantColorMask,
     SquareGradiantColorMask,
     HorizontalGradiantColorMask,
     VerticalGradiantColorMask
 )
-from PIL import Image, ImageDraw
+from PIL import Image
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import argparse
+import collections
+import copy
+import csv
+import functools
+import math
+import os
 import sys
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+try:
+    import segno
+except ImportError:
+    segno = None
+
+
+class _NumpyGradientMixin:
+    """
+    Vectorized apply_mask() for the qrcode gradient color masks.
+    
+    Computes the same colors as QRColorMask.apply_mask(), pixel for pixel,
+    but with NumPy instead of a Python loop. The image is processed in bands
+    of rows and only drawn (non-background) pixels are converted to floats,
+    which keeps memory use modest for large images. Falls back to the stock
+    implementation when NumPy is not installed or the image is not RGB.
+    """
+
+    # Image rows processed per NumPy pass
+    band_rows = 128
+
+    def _gradient(self, x, y, width):
+        """
+        Return (start_color, end_color, t) where t is the position along the
+        gradient of the pixels at coordinates x, y (1-D arrays).
+        """
+        raise NotImplementedError
+
+    def apply_mask(self, image, use_cache=False):
+        if np is None or image.mode != "RGB" or len(self.back_color) != 3:
+            return super().apply_mask(image, use_cache)
+
+        width, height = image.size
+
+        # Interpolation coefficient of each drawn pixel between the back and
+        # paint colors is averaged over the channels where those two differ
+        channels = [i for i in range(3) if self.back_color[i] != self.paint_color[i]]
+        if not channels:
+            image.paste(self.back_color, (0, 0, width, height))
+            return
+
+        back = np.array(self.back_color, dtype=np.float64)
+        for top in range(0, height, self.band_rows):
+            band = np.array(image.crop((0, top, width, min(top + self.band_rows, height))))
+            drawn = (band != back).any(axis=-1)
+            if not drawn.any():
+                continue
+            ys, xs = np.nonzero(drawn)
+            pixels = band[drawn].astype(np.float64)
+
+            norm = np.zeros(len(pixels))
+            for i in channels:
+                norm = norm + (pixels[:, i] - self.back_color[i]) / (self.paint_color[i] - self.back_color[i])
+            norm = (norm / len(channels))[:, None]
+
+            # Foreground gradient color at each pixel, truncated like interp_color()
+            start, end, t = self._gradient(xs, ys + top, width)
+            t = t[:, None]
+            fg = np.trunc(np.array(end) * t + np.array(start) * (1 - t))
+
+            result = np.trunc(fg * norm + back * (1 - norm))
+            band[drawn] = np.clip(result, 0, 255).astype(np.uint8)
+            image.paste(Image.fromarray(band), (0, top))
+
+
+class FastRadialGradiantColorMask(_NumpyGradientMixin, RadialGradiantColorMask):
+    """RadialGradiantColorMask with a vectorized apply_mask()."""
+
+    def _gradient(self, x, y, width):
+        t = np.sqrt((x - width / 2) ** 2 + (y - width / 2) ** 2) / (math.sqrt(2) * width / 2)
+        return self.center_color, self.edge_color, t
+
+
+class FastSquareGradiantColorMask(_NumpyGradientMixin, SquareGradiantColorMask):
+    """SquareGradiantColorMask with a vectorized apply_mask()."""
+
+    def _gradient(self, x, y, width):
+        t = np.maximum(np.abs(x - width / 2), np.abs(y - width / 2)) / (width / 2)
+        return self.center_color, self.edge_color, t
+
+
+class FastHorizontalGradiantColorMask(_NumpyGradientMixin, HorizontalGradiantColorMask):
+    """HorizontalGradiantColorMask with a vectorized apply_mask()."""
+
+    def _gradient(self, x, y, width):
+        return self.left_color, self.right_color, x / width
+
+
+class FastVerticalGradiantColorMask(_NumpyGradientMixin, VerticalGradiantColorMask):
+    """VerticalGradiantColorMask with a vectorized apply_mask()."""
+
+    def _gradient(self, x, y, width):
+        return self.top_color, self.bottom_color, y / width
+
+
+class FastSquarePilImage(StyledPilImage):
+    """
+    StyledPilImage that draws plain square modules in a single pass.
+    
+    Instead of one drawer call per module, the module matrix is turned into a
+    one-pixel-per-module mask, scaled up by box_size with nearest-neighbour
+    resampling and painted with one paste. The color mask is applied as usual.
+    """
+
+    needs_drawrect = False
+
+    def process(self):
+        size = (self.width, self.width)
+        mask = Image.frombytes(
+            "L", size, bytes(255 if module else 0 for row in self.modules for module in row)
+        )
+        modules = Image.new(self._img.mode, size, self.color_mask.back_color)
+        modules.paste(self.paint_color, (0, 0, *size), mask)
+        modules = modules.resize((self.width * self.box_size,) * 2, Image.NEAREST)
+
+        offset = self.border * self.box_size
+        self._img.paste(modules, (offset, offset))
+        super().process()
+
+
+# Map size options to box_size values
+_SIZE_MAP = {
+    "normal": 10,
+    "large": 15,
+    "xlarge": 20
+}
+
+# Map style names to module drawers; built once and shared between renders
+_STYLE_MAP = {
+    "circle": CircleModuleDrawer(),
+    "gapped": GappedSquareModuleDrawer(),
+    "horizontal": HorizontalBarsDrawer(),
+    "rounded": RoundedModuleDrawer(radius_ratio=0.5),  # Adjust radius based on module size
+    "square": SquareModuleDrawer(),
+    "vertical": VerticalBarsDrawer(),
+    "fast": SquareModuleDrawer()  # Drawn in one pass by FastSquarePilImage
+}
+
+# Styles rendered by an image factory other than StyledPilImage
+_IMAGE_FACTORY_MAP = {
+    "fast": FastSquarePilImage
+}
+
+# Module drawer used for unknown style names
+_DEFAULT_MODULE_DRAWER = RoundedModuleDrawer()
+
+# Map gradient types to color masks
+_GRADIENT_MAP = {
+    "radial": FastRadialGradiantColorMask,
+    "square": FastSquareGradiantColorMask,
+    "horizontal": FastHorizontalGradiantColorMask,
+    "vertical": FastVerticalGradiantColorMask
+}
+
+# Color mask constructor arguments for each gradient type, given the edge color
+_GRADIENT_ARGS = {
+    "radial": lambda color: dict(back_color=(255, 255, 255), center_color=(0, 0, 0), edge_color=color),
+    "square": lambda color: dict(back_color=(255, 255, 255), center_color=(0, 0, 0), edge_color=color),
+    "horizontal": lambda color: dict(back_color=(255, 255, 255), left_color=(0, 0, 0), right_color=color),
+    "vertical": lambda color: dict(back_color=(255, 255, 255), top_color=(0, 0, 0), bottom_color=color)
+}
+
+# Batches smaller than this are rendered without a process pool
+_MIN_PARALLEL_BATCH = 4
+
+# Number of payloads handed to a batch worker process at a time
+_BATCH_CHUNK_SIZE = 16
+
+# Threads writing batch images while the next QR code is rendered
+_SAVE_WORKERS = 4
+
+# Memory budget for rendered QR codes kept by _render_qr()
+_RENDER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Command-line parser, built on first use by main()
+_PARSER = None
+
+
+@functools.lru_cache(maxsize=64)
 def parse_color(color_str):
     """
     Parse a color string in hex format (#RRGGBB) to RGB tuple.
@@ -31,24 +221,23 @@ def parse_color(color_str):
     """
     if color_str.startswith('#'):
         color_str = color_str[1:]
-    return tuple(int(color_str[i:i+2], 16) for i in (0, 2, 4))
+    rgb = tuple(bytes.fromhex(color_str[:6]))
+    if len(rgb) != 3:
+        raise ValueError(f"Expected 6 hex digits, got {color_str!r}")
+    return rgb
 
 
-def overlay_logo_on_qr(qr_img, logo_path, logo_gap=0):
+def _logo_size(qr_img, logo_gap=0):
     """
-    Overlay a logo image onto the center of a QR code with optional gap.
+    Get the size of the box a logo is fitted into on a QR code.
     
     Args:
         qr_img (PIL.Image): QR code image
-        logo_path (str): Path to logo image
         logo_gap (int): Number of pixels gap between logo and QR code data
         
     Returns:
-        PIL.Image: QR code with logo overlaid
+        int: Logo size in pixels
     """
-    # Open the logo image
-    logo = Image.open(logo_path)
-    
     # Calculate the size of the logo (typically 10-20% of QR code size)
     qr_width, qr_height = qr_img.size
     logo_size = min(qr_width, qr_height) // 4  # 25% of QR code size
@@ -57,161 +246,593 @@ def overlay_logo_on_qr(qr_img, logo_path, logo_gap=0):
     if logo_gap > 0:
         # Reduce logo size to account for the gap
         logo_size = logo_size - (logo_gap * 2)
+    return logo_size
+
+
+def _prepare_logo(logo_path, logo_size, logo_gap=0):
+    """
+    Load a logo and resize it to fit a QR code.
     
-    # Resize logo while maintaining aspect ratio
-    logo.thumbnail((logo_size, logo_size), Image.LANCZOS)
+    Args:
+        logo_path (str): Path to logo image
+        logo_size (int): Size of the box the logo is fitted into
+        logo_gap (int): Number of pixels gap between logo and QR code data
+        
+    Returns:
+        PIL.Image: Resized logo, ready to paste
+    """
+    # Open the logo image; the file is closed once the resized logo is copied out
+    with Image.open(logo_path) as logo:
+        # Let libjpeg decode JPEG logos at a reduced scale before resizing
+        if logo.format == "JPEG":
+            logo.draft("RGB", (logo_size * 2, logo_size * 2))
+        
+        # Resize logo while maintaining aspect ratio, matching the filter to the
+        # scale factor: Lanczos (after a box reduce) is only worth it for heavy
+        # downscaling, and thumbnail() never upscales
+        ratio = max(logo.size) / logo_size
+        if ratio <= 1.0:
+            resample = Image.NEAREST
+        elif ratio <= 2.0:
+            resample = Image.BOX
+        else:
+            resample = Image.LANCZOS
+        logo.thumbnail(
+            (logo_size, logo_size),
+            resample,
+            reducing_gap=2.0 if resample == Image.LANCZOS else None
+        )
+        
+        # Detach the (now small) decoded logo from the file. A logo with a gap
+        # sits on white anyway, so flatten its transparency over white here
+        # and paste it later as a plain opaque image
+        logo.load()
+        if logo_gap > 0 and logo.mode == 'RGBA':
+            flat = Image.new("RGB", logo.size, (255, 255, 255))
+            flat.paste(logo, mask=logo.getchannel("A"))
+            return flat
+        return logo.copy()
+
+
+def overlay_logo_on_qr(qr_img, logo_path, logo_gap=0, inplace=False):
+    """
+    Overlay a logo image onto the center of a QR code with optional gap.
     
+    Args:
+        qr_img (PIL.Image): QR code image
+        logo_path (str): Path to logo image
+        logo_gap (int): Number of pixels gap between logo and QR code data
+        inplace (bool): Draw onto qr_img itself instead of a copy
+        
+    Returns:
+        PIL.Image: QR code with logo overlaid
+    """
+    logo = _prepare_logo(logo_path, _logo_size(qr_img, logo_gap), logo_gap)
+    return _paste_logo(qr_img, logo, logo_gap, inplace)
+
+
+def _paste_logo(qr_img, logo, logo_gap=0, inplace=False):
+    """
+    Paste a logo prepared by _prepare_logo() onto the center of a QR code.
+    
+    Args:
+        qr_img (PIL.Image): QR code image
+        logo (PIL.Image): Resized logo; it is not modified
+        logo_gap (int): Number of pixels gap between logo and QR code data
+        inplace (bool): Draw onto qr_img itself instead of a copy
+        
+    Returns:
+        PIL.Image: QR code with logo overlaid
+    """
     # Calculate position to center the logo
+    qr_width, qr_height = qr_img.size
     logo_width, logo_height = logo.size
     x = (qr_width - logo_width) // 2
     y = (qr_height - logo_height) // 2
     
-    # Create a copy of the QR code to avoid modifying the original
-    qr_with_logo = qr_img.copy()
+    # Create a copy of the QR code to avoid modifying the original, unless
+    # the caller is going to discard it anyway
+    qr_with_logo = qr_img if inplace else qr_img.copy()
 
 
-    # Draw a white border (rectangle) around the logo area if logo_gap > 0
+    # With a gap, draw the logo onto a white tile covering the logo area plus
+    # the gap on every side (inclusive of the far edge, hence the +1), so the
+    # QR code is only written once
     if logo_gap > 0:
-        border_rect = [
-            x - logo_gap,
-            y - logo_gap,
-            x + logo_width + logo_gap,
-            y + logo_height + logo_gap
-        ]
-        draw = ImageDraw.Draw(qr_with_logo)
-        draw.rectangle(border_rect, fill="white")
-
-    # Paste the logo onto the QR code (after gap is created)
+        tile_size = (logo_width + 2 * logo_gap + 1, logo_height + 2 * logo_gap + 1)
+        target = Image.new(qr_with_logo.mode, tile_size, "white")
+        x0, y0 = logo_gap, logo_gap
+    else:
+        target = qr_with_logo
+        x0, y0 = x, y
+
+    # Paste the logo onto the target (after gap is created)
     if logo.mode == 'RGBA':
-        qr_with_logo.paste(logo, (x, y), logo)
+        # Alpha-composite only the logo's footprint, then blit it back
+        box = (x0, y0, x0 + logo_width, y0 + logo_height)
+        region = Image.alpha_composite(target.crop(box).convert("RGBA"), logo)
+        target.paste(region.convert(target.mode), box)
     else:
-        qr_with_logo.paste(logo, (x, y))
+        target.paste(logo, (x0, y0))
+
+    if logo_gap > 0:
+        qr_with_logo.paste(target, (x - logo_gap, y - logo_gap))
 
     return qr_with_logo
 
 
-def generate_qr_with_logo(data, logo_path=None, logo_gap=0, output_path="qr_code.png", style="rounded", 
-                         gradient_type="radial", gradient_color="#000000", size="normal"):
+@functools.lru_cache(maxsize=64)
+def _make_color_mask(gradient_type, color_rgb):
     """
-    Generate a QR code with optional logo embedding and custom styling.
-
+    Create the color mask for a gradient type, memoized on its arguments.
+    
     Args:
-        data (str): The data to encode in the QR code
-        logo_path (str, optional): Path to logo image to embed in QR code
-        logo_gap (int): Number of pixels gap between logo and QR code data
-        output_path (str): Path where the QR code image will be saved
-        style (str): Style for the QR code modules ("circle", "gapped", "horizontal", 
-                    "rounded", "square", "vertical")
         gradient_type (str): Type of gradient ("radial", "square", "horizontal", "vertical")
-        gradient_color (str): Color for gradient in hex format (#RRGGBB)
-        size (str): Size of the QR code ("normal", "large", "xlarge")
-
+        color_rgb (tuple): Gradient edge color as an RGB tuple
+        
     Returns:
-        None
+        QRColorMask: Color mask for StyledPilImage
+    """
+    # Every gradient starts from black, so a black gradient color is just a
+    # solid black fill, which the module drawers already produce
+    if color_rgb == (0, 0, 0):
+        return SolidFillColorMask(back_color=(255, 255, 255), front_color=(0, 0, 0))
+    
+    # Choose color mask and its constructor arguments based on gradient type,
+    # defaulting to a radial gradient
+    if gradient_type not in _GRADIENT_MAP:
+        gradient_type = "radial"
+    color_mask_class = _GRADIENT_MAP[gradient_type]
+    return color_mask_class(**_GRADIENT_ARGS[gradient_type](color_rgb))
+
+
+class _MatrixQRCode(qrcode.QRCode):
+    """
+    QRCode whose module matrix is produced by another encoder (segno).
+    
+    Only the encoding step is replaced: make_image() and the module drawers
+    work on the matrix exactly as on one made by qrcode itself.
+    """
+
+    def set_matrix(self, matrix, version):
+        self.modules = [[bool(module) for module in row] for row in matrix]
+        self.modules_count = len(self.modules)
+        self.version = version
+
+    def make(self, fit=True):
+        # The matrix is set by set_matrix(); there is nothing to encode
+        pass
+
+
+def _use_segno(backend):
     """
-    # Map size options to box_size values
-    size_map = {
-        "normal": 10,
-        "large": 15,
-        "xlarge": 20
-    }
+    Return True if data should be encoded with segno for this backend.
     
+    Falls back to qrcode when segno is not installed.
+    """
+    return backend == "segno" and segno is not None
+
+
+def _make_qr(size, qr_class=qrcode.QRCode):
+    """
+    Create an empty QR code encoder for the given size.
+    
+    Args:
+        size (str): Size of the QR code ("normal", "large", "xlarge")
+        qr_class (type): QRCode class to instantiate
+        
+    Returns:
+        qrcode.QRCode: QR code encoder with high error correction
+    """
     # Get box_size based on size parameter
-    box_size = size_map.get(size, 10)
-    
-    # Map style names to module drawers (with size-aware rounded style)
-    style_map = {
-        "circle": CircleModuleDrawer(),
-        "gapped": GappedSquareModuleDrawer(),
-        "horizontal": HorizontalBarsDrawer(),
-        "rounded": RoundedModuleDrawer(radius_ratio=0.5),  # Adjust radius based on module size
-        "square": SquareModuleDrawer(),
-        "vertical": VerticalBarsDrawer()
-    }
-    
-    # Map gradient types to color masks
-    gradient_map = {
-        "radial": RadialGradiantColorMask,
-        "square": SquareGradiantColorMask,
-        "horizontal": HorizontalGradiantColorMask,
-        "vertical": VerticalGradiantColorMask
-    }
+    box_size = _SIZE_MAP.get(size, 10)
     
     # Create QR code with high error correction for logo embedding
-    qr = qrcode.QRCode(
+    return qr_class(
         version=1,
         error_correction=qrcode.constants.ERROR_CORRECT_H,
         box_size=box_size,
         border=4,
     )
-    qr.add_data(data)
-    qr.make(fit=True)
 
-    # Choose module drawer based on style
-    module_drawer = style_map.get(style, RoundedModuleDrawer())
+
+def _resolve_color(gradient_color):
+    """
+    Parse a gradient color, warning and falling back to black if invalid.
     
-    # Parse gradient color
+    Args:
+        gradient_color (str): Color for gradient in hex format (#RRGGBB)
+        
+    Returns:
+        tuple: RGB tuple (r, g, b)
+    """
     try:
-        color_rgb = parse_color(gradient_color)
+        return parse_color(gradient_color)
     except (ValueError, IndexError):
         print(f"Invalid color format: {gradient_color}. Using default black (#000000)")
-        color_rgb = (0, 0, 0)
+        return (0, 0, 0)
+
+
+def _style_components(style, gradient_type, color_rgb):
+    """
+    Resolve the module drawer and color mask for a style.
+    
+    Args:
+        style (str): Style for the QR code modules
+        gradient_type (str): Type of gradient
+        color_rgb (tuple): Gradient edge color as an RGB tuple
+        
+    Returns:
+        tuple: (module_drawer, color_mask)
+    """
+    # Choose module drawer based on style
+    module_drawer = _STYLE_MAP.get(style, _DEFAULT_MODULE_DRAWER)
     
-    # Generate the QR code image with gradient
     # Choose color mask based on gradient type
-    color_mask_class = gradient_map.get(gradient_type, RadialGradiantColorMask)
-    
-    # Create color mask with appropriate parameters for each type
-    if gradient_type in ["radial", "square"]:
-        color_mask = color_mask_class(
-            back_color=(255, 255, 255),
-            center_color=(0, 0, 0),
-            edge_color=color_rgb
-        )
-    elif gradient_type == "horizontal":
-        color_mask = color_mask_class(
-            back_color=(255, 255, 255),
-            left_color=(0, 0, 0),
-            right_color=color_rgb
-        )
-    elif gradient_type == "vertical":
-        color_mask = color_mask_class(
-            back_color=(255, 255, 255),
-            top_color=(0, 0, 0),
-            bottom_color=color_rgb
-        )
-    else:
-        # Default to radial gradient
-        color_mask = color_mask_class(
-            back_color=(255, 255, 255),
-            center_color=(0, 0, 0),
-            edge_color=color_rgb
-        )
+    color_mask = _make_color_mask(gradient_type, color_rgb)
+    return module_drawer, color_mask
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_qr(data, backend="qrcode"):
+    """
+    Encode data into a QR code module matrix, memoized on the data.
+    
+    The module layout does not depend on box size or styling, so one
+    encoding is shared by every size and style rendered for the same data.
+    The returned encoder is shared between calls, so callers must copy it
+    before changing its settings.
+    
+    Args:
+        data (str): The data to encode in the QR code
+        backend (str): Encoder to use ("qrcode" or "segno")
+        
+    Returns:
+        qrcode.QRCode: Encoder with the module matrix already made
+    """
+    if _use_segno(backend):
+        qr = _make_qr("normal", _MatrixQRCode)
+        symbol = segno.make_qr(data, error="h")
+        qr.set_matrix(symbol.matrix, symbol.version)
+        return qr
+
+    qr = _make_qr("normal")
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr
+
+
+class _ImageCache:
+    """
+    Least-recently-used cache of images, bounded by their total pixel bytes.
+    
+    Images larger than the whole budget are not cached at all.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._images = collections.OrderedDict()
+
+    def get(self, key):
+        img = self._images.get(key)
+        if img is not None:
+            self._images.move_to_end(key)
+        return img
+
+    def put(self, key, img):
+        size = img.width * img.height * len(img.getbands())
+        if size > self.max_bytes or key in self._images:
+            return
+        self._images[key] = img
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, old = self._images.popitem(last=False)
+            self.nbytes -= old.width * old.height * len(old.getbands())
+
+    def clear(self):
+        self._images.clear()
+        self.nbytes = 0
+
+
+# Rendered QR codes shared between generate_qr_with_logo() calls
+_RENDER_CACHE = _ImageCache(max_bytes=_RENDER_CACHE_MAX_BYTES)
+
+
+def _render_qr(data, style, gradient_type, color_rgb, size, backend="qrcode"):
+    """
+    Render a styled QR code image (without logo), memoized on its arguments.
+    
+    The returned image is shared between calls with identical arguments, so
+    callers must copy it before modifying it. Use _RENDER_CACHE.clear() to
+    drop cached images.
+    
+    Args:
+        data (str): The data to encode in the QR code
+        style (str): Style for the QR code modules
+        gradient_type (str): Type of gradient
+        color_rgb (tuple): Gradient edge color as an RGB tuple
+        size (str): Size of the QR code ("normal", "large", "xlarge")
+        backend (str): Encoder to use ("qrcode" or "segno")
+        
+    Returns:
+        PIL.Image: Rendered QR code image
+    """
+    key = (data, style, gradient_type, color_rgb, size, backend)
+    img = _RENDER_CACHE.get(key)
+    if img is None:
+        img = _draw_qr(*key)
+        _RENDER_CACHE.put(key, img)
+    return img
+
+
+def _draw_qr(data, style, gradient_type, color_rgb, size, backend):
+    """
+    Render a styled QR code image (without logo). Arguments are as for
+    _render_qr().
+    
+    Returns:
+        PIL.Image: Rendered QR code image
+    """
+    # Reuse the cached encoding and only change the box size
+    qr = copy.copy(_encode_qr(data, backend))
+    qr.box_size = _SIZE_MAP.get(size, 10)
+
+    module_drawer, color_mask = _style_components(style, gradient_type, color_rgb)
     
     # Generate QR code with gradient
     img = qr.make_image(
-        image_factory=StyledPilImage,
+        image_factory=_IMAGE_FACTORY_MAP.get(style, StyledPilImage),
         module_drawer=module_drawer,
         color_mask=color_mask
     )
+    return img.get_image()
+
+
+def _save_image(img, output_path, fast_save=False):
+    """
+    Save a QR code image, choosing encoder settings from the file extension.
     
-    # If logo is specified, overlay it manually
+    WebP output is always lossless. With fast_save, PNG and WebP are encoded
+    with the fastest settings, trading file size for encode time.
+    
+    Args:
+        img (PIL.Image): Image to save
+        output_path (str): Path where the image will be saved
+        fast_save (bool): Favor encode speed over file size
+        
+    Returns:
+        None
+    """
+    ext = os.path.splitext(output_path)[1].lower()
+    if ext == ".webp":
+        if fast_save:
+            img.save(output_path, "WEBP", lossless=True, quality=0, method=0)
+        else:
+            img.save(output_path, "WEBP", lossless=True)
+    elif ext == ".png" and fast_save:
+        img.save(output_path, format="PNG", optimize=False, compress_level=1)
+    else:
+        img.save(output_path)
+
+
+def _save_and_report(img, output_path, fast_save=False):
+    """
+    Save a QR code image and return where it was written.
+    
+    Runs on the batch save threads, so reporting is left to the caller to
+    keep the output in order.
+    
+    Args:
+        img (PIL.Image): Image to save
+        output_path (str): Path where the image will be saved
+        fast_save (bool): Favor encode speed over file size
+        
+    Returns:
+        str: output_path
+    """
+    _save_image(img, output_path, fast_save)
+    return output_path
+
+
+def generate_qr_with_logo(data, logo_path=None, logo_gap=0, output_path="qr_code.png", style="rounded", 
+                         gradient_type="radial", gradient_color="#000000", size="normal",
+                         fast_save=False, backend="qrcode"):
+    """
+    Generate a QR code with optional logo embedding and custom styling.
+
+    Args:
+        data (str): The data to encode in the QR code
+        logo_path (str, optional): Path to logo image to embed in QR code
+        logo_gap (int): Number of pixels gap between logo and QR code data
+        output_path (str): Path where the QR code image will be saved
+        style (str): Style for the QR code modules ("circle", "gapped", "horizontal", 
+                    "rounded", "square", "vertical", "fast")
+        gradient_type (str): Type of gradient ("radial", "square", "horizontal", "vertical")
+        gradient_color (str): Color for gradient in hex format (#RRGGBB)
+        size (str): Size of the QR code ("normal", "large", "xlarge")
+        fast_save (bool): Favor encode speed over file size when saving
+        backend (str): Encoder for the QR code matrix: "qrcode", or "segno"
+                      if installed (falls back to "qrcode" otherwise)
+
+    Returns:
+        None
+    """
+    # Render (or reuse) the styled QR code; the cached image is never modified
+    color_rgb = _resolve_color(gradient_color)
+    img = _render_qr(data, style, gradient_type, color_rgb, size, backend)
+    
+    # If logo is specified, overlay it manually (on a copy, as img is cached)
     if logo_path:
         img = overlay_logo_on_qr(img, logo_path, logo_gap)
 
     # Save the image
-    img.save(output_path)
-    print(f"QR code saved to {output_path}")
+    print(f"QR code saved to {_save_and_report(img, output_path, fast_save)}")
 
 
-def main():
+def _generate_batch_serial(payloads, logo_path, logo_gap, style, gradient_type,
+                           color_rgb, size, fast_save=False, backend="qrcode"):
+    """
+    Generate a batch of QR codes in the current process.
+    
+    The QR code encoder, module drawer and color mask are created once and
+    reused for every payload. Images are written by a small thread pool
+    (image encoding releases the GIL) while the next code is rendered.
+    Arguments are as for generate_qr_batch(), except that the gradient
+    color is passed already parsed as color_rgb.
+    
+    Returns:
+        None
+    """
+    use_segno = _use_segno(backend)
+    qr = _make_qr(size, _MatrixQRCode if use_segno else qrcode.QRCode)
+    module_drawer, color_mask = _style_components(style, gradient_type, color_rgb)
+    logos = {}
+
+    with ThreadPoolExecutor(max_workers=_SAVE_WORKERS) as save_pool:
+        pending = collections.deque()
+        for data, output_path in payloads:
+            if use_segno:
+                symbol = segno.make_qr(data, error="h")
+                qr.set_matrix(symbol.matrix, symbol.version)
+            else:
+                # Reset the encoder; best fit starts from the current version, so
+                # rewind it too or short payloads would inherit a larger symbol
+                qr.clear()
+                qr.version = 1
+                qr.add_data(data)
+                qr.make(fit=True)
+
+            img = qr.make_image(
+                image_factory=_IMAGE_FACTORY_MAP.get(style, StyledPilImage),
+                module_drawer=module_drawer,
+                color_mask=color_mask
+            ).get_image()
+
+            if logo_path:
+                # Load and resize the logo once per QR code size
+                logo_size = _logo_size(img, logo_gap)
+                if logo_size not in logos:
+                    logos[logo_size] = _prepare_logo(logo_path, logo_size, logo_gap)
+                img = _paste_logo(img, logos[logo_size], logo_gap, inplace=True)
+
+            pending.append(save_pool.submit(_save_and_report, img, output_path, fast_save))
+
+            # Limit how many rendered images wait in memory to be written;
+            # writes are reported here, in payload order
+            if len(pending) >= 2 * _SAVE_WORKERS:
+                print(f"QR code saved to {pending.popleft().result()}")
+
+        # Report the remaining writes, raising any error
+        while pending:
+            print(f"QR code saved to {pending.popleft().result()}")
+
+
+def generate_qr_batch(payloads, logo_path=None, logo_gap=0, style="rounded",
+                      gradient_type="radial", gradient_color="#000000", size="normal",
+                      fast_save=False, max_workers=None, backend="qrcode"):
+    """
+    Generate many QR codes sharing the same styling.
+    
+    Payloads are split into chunks rendered in parallel by a process pool;
+    each worker reuses one encoder, module drawer and color mask for its
+    chunk. Small batches are rendered in the current process.
+
+    Args:
+        payloads (iterable): Pairs of (data, output_path)
+        logo_path (str, optional): Path to logo image to embed in each QR code
+        logo_gap (int): Number of pixels gap between logo and QR code data
+        style (str): Style for the QR code modules
+        gradient_type (str): Type of gradient
+        gradient_color (str): Color for gradient in hex format (#RRGGBB)
+        size (str): Size of the QR code ("normal", "large", "xlarge")
+        fast_save (bool): Favor encode speed over file size when saving
+        max_workers (int, optional): Number of worker processes
+            (defaults to the number of CPUs)
+        backend (str): Encoder for the QR code matrix: "qrcode", or "segno"
+                      if installed (falls back to "qrcode" otherwise)
+
+    Returns:
+        None
+    """
+    payloads = list(payloads)
+    render = functools.partial(
+        _generate_batch_serial,
+        logo_path=logo_path,
+        logo_gap=logo_gap,
+        style=style,
+        gradient_type=gradient_type,
+        color_rgb=_resolve_color(gradient_color),
+        size=size,
+        fast_save=fast_save,
+        backend=backend
+    )
+
+    # Spread the payloads over all workers, in chunks of at most
+    # _BATCH_CHUNK_SIZE so workers that finish early can pick up more
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = max(1, min(_BATCH_CHUNK_SIZE, math.ceil(len(payloads) / max_workers)))
+    chunks = [
+        payloads[i:i + chunk_size]
+        for i in range(0, len(payloads), chunk_size)
+    ]
+
+    # Not worth the process start-up cost for a handful of codes, or when
+    # a single worker would end up rendering everything anyway
+    if len(payloads) < _MIN_PARALLEL_BATCH or max_workers == 1 or len(chunks) < 2:
+        render(payloads)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+        # Consume the results so worker exceptions are raised here
+        list(pool.map(render, chunks))
+
+
+def _read_batch_csv(csv_path):
+    """
+    Read (data, output_path) pairs from a batch CSV file.
+    
+    Args:
+        csv_path (str): CSV file with one "data,output_path" row per QR code
+        
+    Returns:
+        list: Pairs of (data, output_path)
+        
+    Raises:
+        ValueError: If a non-empty row does not have exactly two columns
+    """
+    payloads = []
+    with open(csv_path, newline="") as f:
+        reader = csv.reader(f)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != 2:
+                raise ValueError(
+                    f"{csv_path}, line {reader.line_num}: expected 2 columns "
+                    f"(data,output), got {len(row)}"
+                )
+            payloads.append((row[0], row[1]))
+    return payloads
+
+
+def _build_parser():
+    """
+    Build the command-line argument parser.
+    
+    Returns:
+        argparse.ArgumentParser: Parser for the QR code CLI
+    """
     parser = argparse.ArgumentParser(description="Generate QR codes with optional logos")
-    parser.add_argument("data", help="Data to encode in QR code")
+    parser.add_argument("data", nargs="?", help="Data to encode in QR code")
+    parser.add_argument("--batch", metavar="CSV",
+                       help="CSV file of data,output rows to generate in one run")
     parser.add_argument("--logo", help="Path to logo image")
     parser.add_argument("--logo-gap", type=int, default=0, help="Gap between logo and QR code data in pixels")
-    parser.add_argument("--output", default="qr_code.png", help="Output file path")
+    parser.add_argument("--output",
+                       help="Output file path, default qr_code.png (.webp output is saved lossless)")
     parser.add_argument("--style", choices=["circle", "gapped", "horizontal", "rounded", 
-                                          "square", "vertical"], 
+                                          "square", "vertical", "fast"], 
                        default="rounded", help="QR code module style")
     parser.add_argument("--gradient-type", choices=["radial", "square", "horizontal", "vertical"],
                        default="radial", help="Gradient type for QR code")
@@ -219,19 +840,53 @@ def main():
                        help="Gradient color in hex format (#RRGGBB)")
     parser.add_argument("--size", choices=["normal", "large", "xlarge"],
                        default="normal", help="Size of the QR code")
+    parser.add_argument("--fast-save", action="store_true",
+                       help="Encode PNG/WebP output faster at the cost of larger files")
+    parser.add_argument("--backend", choices=["qrcode", "segno"], default="qrcode",
+                       help="Library used to encode the QR code matrix (segno must be installed)")
+    return parser
+
+
+def main():
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
     
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
+    if args.batch is not None:
+        # Batch rows carry their own data and output paths
+        if args.data is not None:
+            _PARSER.error("data cannot be combined with --batch")
+        if args.output is not None:
+            _PARSER.error("--output cannot be combined with --batch")
+    elif args.data is None:
+        _PARSER.error("either data or --batch is required")
     
     try:
+        if args.batch:
+            generate_qr_batch(
+                _read_batch_csv(args.batch),
+                args.logo,
+                args.logo_gap,
+                args.style,
+                args.gradient_type,
+                args.gradient_color,
+                args.size,
+                args.fast_save,
+                backend=args.backend
+            )
+            return
         generate_qr_with_logo(
             args.data, 
             args.logo, 
             args.logo_gap,
-            args.output, 
+            args.output or "qr_code.png", 
             args.style,
             args.gradient_type,
             args.gradient_color,
-            args.size
+            args.size,
+            args.fast_save,
+            args.backend
         )
     except Exception as e:
         print(f"Error generating QR code: {e}")
@@ -0,0 +1,77 @@
+import pytest
+from PIL import Image, ImageChops
+from qrcode.image.styledpil import StyledPilImage
+from qrcode.image.styles.colormasks import (
+    HorizontalGradiantColorMask,
+    RadialGradiantColorMask,
+    SquareGradiantColorMask,
+    VerticalGradiantColorMask,
+)
+
+import main
+
+STOCK_GRADIENTS = {
+    "radial": RadialGradiantColorMask,
+    "square": SquareGradiantColorMask,
+    "horizontal": HorizontalGradiantColorMask,
+    "vertical": VerticalGradiantColorMask,
+}
+
+
+def render_with_mask(color_mask, style="rounded"):
+    qr = main._make_qr("normal")
+    qr.add_data("https://example.com/gradient")
+    qr.make(fit=True)
+    return qr.make_image(
+        image_factory=StyledPilImage,
+        module_drawer=main._STYLE_MAP[style],
+        color_mask=color_mask,
+    ).get_image()
+
+
+@pytest.mark.parametrize("style", ["rounded", "circle"])
+@pytest.mark.parametrize("color", [(255, 0, 0), (0, 0, 255), (30, 140, 200)])
+@pytest.mark.parametrize("gradient_type", sorted(STOCK_GRADIENTS))
+def test_fast_gradient_masks_match_stock(gradient_type, color, style):
+    pytest.importorskip("numpy")
+    kwargs = main._GRADIENT_ARGS[gradient_type](color)
+
+    stock = render_with_mask(STOCK_GRADIENTS[gradient_type](**kwargs), style)
+    fast = render_with_mask(main._GRADIENT_MAP[gradient_type](**kwargs), style)
+
+    assert ImageChops.difference(stock, fast).getbbox() is None
+
+
+def test_segno_backend_sets_version():
+    segno = pytest.importorskip("segno")
+    data = "https://example.com/" + "x" * 200
+
+    qr = main._encode_qr(data, "segno")
+
+    assert qr.version == segno.make_qr(data, error="h").version > 1
+    assert qr.modules_count == qr.version * 4 + 17
+
+
+@pytest.mark.parametrize("bad_row", ["only-data", "data,out.png,extra"])
+def test_read_batch_csv_rejects_wrong_column_count(tmp_path, bad_row):
+    csv_path = tmp_path / "codes.csv"
+    csv_path.write_text(f"https://example.com,ok.png\n{bad_row}\n")
+
+    with pytest.raises(ValueError, match="line 2"):
+        main._read_batch_csv(csv_path)
+
+
+def test_batch_matches_single_when_payloads_shrink(tmp_path):
+    # Long payloads first, so the batch encoder has to come back down to
+    # smaller versions for the later ones
+    data = ["https://example.com/" + "x" * n for n in (300, 120, 40, 0)]
+    payloads = [(d, str(tmp_path / f"batch_{i}.png")) for i, d in enumerate(data)]
+
+    main.generate_qr_batch(payloads, gradient_color="#FF0000", max_workers=1)
+
+    for i, d in enumerate(data):
+        single_path = tmp_path / f"single_{i}.png"
+        main.generate_qr_with_logo(d, output_path=str(single_path), gradient_color="#FF0000")
+        with Image.open(payloads[i][1]) as batch, Image.open(single_path) as single:
+            assert batch.size == single.size
+            assert ImageChops.difference(batch, single).getbbox() is None